@@ -194,6 +194,9 @@ class XPlot:
                     DataProperty(name, arg) if isinstance(arg, str) else arg
                 )
         self._display_units = defaults(display_units, s="m", x="mm", y="mm", p="mrad")
+        self._prop_cache = {}
+        self._label_for_cache = {}
+        self._factor_cache = {}
 
         if annotation is None:
             annotation = ax is None
@@ -227,6 +230,8 @@ class XPlot:
                         twin.spines.right.set_position(("axes", 1 + 0.2 * j))
                     self.axflat_twin[i].append(twin)
 
+        self._blit_background = None
+
         # Create annotation
         if annotation:
             self.annotation = self.fig.text(
@@ -294,6 +299,32 @@ class XPlot:
             ax.set(xlim=ax.get_xlim(), ylim=ax.get_ylim())
             ax.set_autoscale_on(False)
 
+    def enable_blitting(self):
+        """Enable blitting for fast partial redraws
+
+        Performs a full draw and stores the figure as background. Subsequent
+        calls to :meth:`blit` then only redraw changed artists on top of it.
+        Call this method again whenever the background (axes limits, labels,
+        static artists) has changed.
+        """
+        self.fig.canvas.draw()
+        self._blit_background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+    def blit(self, artists):
+        """Redraw only the given artists over the stored background
+
+        Args:
+            artists (list): Artists to draw, e.g. as returned by an update method.
+        """
+        if self._blit_background is None:
+            self.enable_blitting()
+        canvas = self.fig.canvas
+        canvas.restore_region(self._blit_background)
+        for art in flattened(artists):
+            if art is not None and art.axes is not None:
+                art.axes.draw_artist(art)
+        canvas.blit(self.fig.bbox)
+
     def annotate(self, text, **kwargs):
         if self.annotation is not None:
             self.annotation.set(text=text, **kwargs)
@@ -342,7 +373,13 @@ class XPlot:
         Returns:
             float: Factor to convert parameter into display unit
         """
-        return pint.Quantity(1, self.prop(p).unit).to(self.display_unit_for(p)).m
+        # memoized since the pint unit conversion is costly and update methods
+        # call this repeatedly (display units do not change after construction)
+        if p not in self._factor_cache:
+            self._factor_cache[p] = (
+                pint.Quantity(1, self.prop(p).unit).to(self.display_unit_for(p)).m
+            )
+        return self._factor_cache[p]
 
     def display_unit_for(self, p):
         """Return display unit for parameter
@@ -372,12 +409,14 @@ class XPlot:
         Returns:
             Property: The property
         """
-        prop = find_property(
-            name,
-            extra_user_properties=self._user_properties,
-            extra_default_properties=self._default_properties,
-        )
-        return prop.with_property_resolver(self.prop)
+        if name not in self._prop_cache:
+            prop = find_property(
+                name,
+                extra_user_properties=self._user_properties,
+                extra_default_properties=self._default_properties,
+            )
+            self._prop_cache[name] = prop.with_property_resolver(self.prop)
+        return self._prop_cache[name]
 
     def _legend_label_for(self, p):
         """
@@ -442,6 +481,11 @@ class XPlot:
         if len(pp) == 0:
             return ""
 
+        # labels are pure functions of the properties, memoize them
+        cache_key = (*pp, unit, description)
+        if cache_key in self._label_for_cache:
+            return self._label_for_cache[cache_key]
+
         # if there are different units, treat them separately
         units = np.array([self.display_unit_for(p) for p in pp])
         if unit and np.unique(units).size > 1:
@@ -488,6 +532,7 @@ class XPlot:
                     label = f"({label})"
                 label += append
 
+        self._label_for_cache[cache_key] = label
         return label
 
     @staticmethod
@@ -39,9 +39,12 @@ def iter_elements(line):
         yield name, el, s0, s1
 
 
+_KNL_PATTERN = re.compile(r"k(\d+)l")
+
+
 def order(knl):
     """Get order of knl string as int"""
-    return int(re.match(r"k(\d+)l", knl).group(1))
+    return int(_KNL_PATTERN.match(knl).group(1))
 
 
 class KnlPlot(XManifoldPlot):
@@ -72,7 +75,8 @@ class KnlPlot(XManifoldPlot):
         if knl is None:
             if line is None:
                 raise ValueError("Either line or knl parameter must not be None")
-            knl = range(max([e.order for e in line.elements if hasattr(e, "order")]) + 1)
+            orders = np.array([getattr(e, "order", -1) for e in line.elements], dtype=np.int32)
+            knl = range(int(orders.max(initial=-1)) + 1)
         if isinstance(knl, int):
             knl = range(knl + 1)
         if not isinstance(knl, str):
@@ -85,10 +89,21 @@ class KnlPlot(XManifoldPlot):
         super().__init__(on_x="s", on_y=knl, **kwargs)
 
         # create plot elements
+        self._fill_vertices = {}
+
         def create_artists(i, j, k, a, p):
             kwargs = dict(color=f"C{order(p)}", alpha=0.5, label=self.label_for(p, unit=True))
             if self.filled:
-                return a.fill_between(self.S, np.zeros_like(self.S), zorder=3, lw=0, **kwargs)
+                art = a.fill_between(self.S, np.zeros_like(self.S), zorder=3, lw=0, **kwargs)
+                # fill_between paths are not simplified by default, but for dense
+                # sampling this speeds up rendering considerably
+                for path in art.get_paths():
+                    path.should_simplify = True
+                if self.S.size > 5000:
+                    art.set_rasterized(True)
+                # keep a reference to the vertex buffer for in-place updates
+                self._fill_vertices[i, j, k] = art.get_paths()[0].vertices
+                return art
             else:
                 return a.plot([], [], **kwargs)[0]
 
@@ -98,46 +113,121 @@ class KnlPlot(XManifoldPlot):
             a.plot(self.S, np.zeros_like(self.S), "k-", lw=1, zorder=4)
         self.legend(show="auto", ncol=5)
 
+        self._line_cache = None
+
+        # display unit factors are fixed per construction, compute them once
+        self._s_factor = self.factor_for("s")
+        self._y_factors = {p: self.factor_for(p) for p in self.on_y_unique}
+
         # set data
         if line is not None:
             self.update(line, autoscale=True)
 
-    def update(self, line, autoscale=False):
+    def _cache_line(self, line):
+        """Walk the line once and cache element data as structure-of-arrays
+
+        Collects the sample index ranges and multipole strengths of all elements
+        with a knl attribute into contiguous arrays, so that `update` becomes
+        pure vectorized NumPy.
+
+        Args:
+            line (xtrack.Line): Line of elements.
+
+        Returns:
+            dict: Arrays i0, i1 (sample index ranges) and knl (strength matrix).
+        """
+        ns = sorted({order(p) for p in self.on_y_unique})
+        nmax = ns[-1]
+        Smax = line.get_length()
+
+        # element intervals with thin lenses located at element center
+        s_up = np.asarray(line.get_s_elements("upstream"), dtype=float)
+        s_dn = np.asarray(line.get_s_elements("downstream"), dtype=float)
+        lengths = np.array([getattr(el, "length", 0.0) for el in line.elements])
+        thin = s_up == s_dn
+        s_up = np.where(thin, s_up - lengths / 2, s_up)
+        s_dn = np.where(thin, s_dn + lengths / 2, s_dn)
+
+        # dense strength matrix with one row per element
+        knl_mat = np.zeros((len(line.elements), nmax + 1))
+        has_knl = np.zeros(len(line.elements), dtype=bool)
+        for i, el in enumerate(line.elements):
+            knl = getattr(el, "knl", None)
+            if knl is not None:
+                n = min(el.order, nmax) + 1
+                knl_mat[i, :n] = knl[:n]
+                has_knl[i] = True
+
+        # skip elements which contribute nothing to any of the plotted orders
+        has_knl &= knl_mat[:, ns].any(axis=1)
+
+        # handle wrap around by splitting affected elements into a tail
+        # interval [s0 % Smax, end) and an extra head interval [start, s1 % Smax)
+        idx = np.flatnonzero(has_knl)
+        s0, s1 = s_up[idx], s_dn[idx]
+        wrap = (s0 < 0) | (s0 > Smax)
+        s0_all = np.concatenate([np.where(wrap, s0 % Smax, s0), np.full(wrap.sum(), -np.inf)])
+        s1_all = np.concatenate([np.where(wrap, np.inf, s1), s1[wrap] % Smax])
+        rows = np.concatenate([idx, idx[wrap]]).astype(int)
+        return dict(
+            i0=np.searchsorted(self.S, s0_all, "left"),
+            i1=np.searchsorted(self.S, s1_all, "left"),
+            knl=knl_mat[rows].reshape(-1, nmax + 1),
+        )
+
+    def invalidate_line_cache(self):
+        """Invalidate cached line data, forcing a re-read on the next update"""
+        self._line_cache = None
+
+    def update(self, line, autoscale=False, *, blit=False):
         """
         Update the line data this plot shows
 
+        Note that the element data of the line is cached. When passing a different
+        line object the cache is refreshed, but in-place changes of element
+        strengths require a call to :meth:`invalidate_line_cache`.
+
         Args:
             line (xtrack.Line): Line of elements.
             autoscale (bool): Whether or not to perform autoscaling on all axes
+            blit (bool): If True, only redraw the changed artists over the
+                background stored by :meth:`~.base.XPlot.enable_blitting`
+                (much faster than a full redraw for repeated updates).
 
         Returns:
             changed artists
         """
         # compute knl as function of s
-        values = {p: np.zeros(self.S.size) for p in self.on_y_unique}
         orders = {p: order(p) for p in self.on_y_unique}
-        Smax = line.get_length()
-        for name, el, s0, s1 in iter_elements(line):
-            if hasattr(el, "knl"):
-                if 0 <= s0 <= Smax:
-                    mask = (self.S >= s0) & (self.S < s1)
-                else:
-                    # handle wrap around
-                    mask = (self.S >= s0 % Smax) | (self.S < s1 % Smax)
-                for knl, n in orders.items():
-                    if n <= el.order:
-                        values[knl][mask] += el.knl[n]
+        # single-entry cache holding the line itself, compared by identity
+        # (keeping the reference also keeps the object's id valid)
+        if self._line_cache is None or self._line_cache[0] is not line:
+            self._line_cache = (line, self._cache_line(line))
+        i0, i1, knl_matrix = (self._line_cache[1][k] for k in ("i0", "i1", "knl"))
+
+        # accumulate interval contributions of all orders at once on an edge-delta
+        # matrix and integrate with a cumulative sum (much faster than per-element
+        # boolean masks or a separate pass per order)
+        delta = np.zeros((self.S.size + 1, knl_matrix.shape[1]))
+        np.add.at(delta, i0, knl_matrix)
+        np.add.at(delta, i1, -knl_matrix)
+        values_matrix = np.cumsum(delta[:-1], axis=0)
+        values = {p: values_matrix[:, n] for p, n in orders.items()}
 
         # plot
-        s = self.S * self.factor_for("s")
+        s = self.S * self._s_factor
+        slim = (s[0], s[-1])  # S is sorted, so min/max are the endpoints
         changed = []
         for i, ppp in enumerate(self.on_y):
             for j, pp in enumerate(ppp):
                 for k, p in enumerate(pp):
                     art = self.artists[i][j][k]
-                    y = self.factor_for(p) * values[p]
+                    y = self._y_factors[p] * values[p]
                     if self.filled:
-                        art.get_paths()[0].vertices[1 : 1 + y.size, 1] = y
+                        # write directly into the preallocated vertex buffer,
+                        # bypassing the costly set_verts conversion
+                        self._fill_vertices[i, j, k][1 : 1 + y.size, 1] = y
+                        art.stale = True
                     else:
                         art.set_data((s, y))
                     changed.append(art)
@@ -153,14 +243,21 @@ class KnlPlot(XManifoldPlot):
                     else:
                         ax.relim()
                     ax.autoscale()
-                    ax.set(xlim=(np.min(s), np.max(s)))
+                    ax.set(xlim=slim)
+
+        if blit:
+            self.blit(changed)
 
         return changed
 
     def prop(self, p):
-        if match := re.fullmatch(r"k(\d+)l", p):
+        if p not in self._prop_cache and (match := _KNL_PATTERN.fullmatch(p)):
             n = match.group(1)
-            return Property(symbol=f"$k_{n}l$", unit="rad" if n == "0" else f"m^-{n}")
+            self._prop_cache[p] = Property(
+                symbol=f"$k_{n}l$", unit="rad" if n == "0" else f"m^-{n}"
+            )
+        if p in self._prop_cache:
+            return self._prop_cache[p]
         return super().prop(p)
 
     def label_for(self, *pp, unit=True, description=True):
@@ -175,7 +272,7 @@ class KnlPlot(XManifoldPlot):
         Returns:
             str: Axis label
         """
-        if len(pp) > 1 and np.all([re.match(r"k\d+l", p) for p in pp]):
+        if len(pp) > 1 and np.all([_KNL_PATTERN.match(p) for p in pp]):
             label = "$k_nl$"
             if unit:
                 label += " / $m^{-n}$"
@@ -253,6 +350,18 @@ class FloorPlot(XPlot):
         if isinstance(self.labels, (list, tuple, np.ndarray)):
             self.labels = "|".join(["^" + ll + "$" for ll in self.labels])
 
+        # precompile patterns matched against every element name during update
+        self.ignore = None if self.ignore is None else re.compile("|".join(self.ignore))
+        if isinstance(self.boxes, str):
+            self.boxes = re.compile(self.boxes)
+        if isinstance(self.labels, str):
+            self.labels = re.compile(self.labels)
+        # build fresh dicts instead of rewriting the caller-owned ones in place
+        if isinstance(self.boxes, dict):
+            self.boxes = {re.compile(k): v for k, v in self.boxes.items()}
+        if isinstance(self.labels, dict):
+            self.labels = {re.compile(k): v for k, v in self.labels.items()}
+
         # Create plot
         self.ax.set(
             xlabel=self.label_for(self.projection[0]), ylabel=self.label_for(self.projection[1])
@@ -267,12 +376,15 @@ class FloorPlot(XPlot):
         self.ax.add_patch(self.artist_startpoint)
         self.artists_boxes = []
         self.artists_labels = []
+        # per pooled label artist: default value of every key ever styled on it
+        self._label_pristine_styles = []
+        self._element_cache = None
 
         # set data
         if survey is not None:
             self.update(survey, line, autoscale=True)
 
-    def update(self, survey, line=None, autoscale=False):
+    def update(self, survey, line=None, autoscale=False, *, blit=False):
         """
         Update the survey data this plot shows
 
@@ -280,6 +392,9 @@ class FloorPlot(XPlot):
             survey (Any): Survey data.
             line (None | xtrack.Line): Line data.
             autoscale (bool): Whether or not to perform autoscaling on all axes
+            blit (bool): If True, only redraw the changed artists over the
+                background stored by :meth:`~.base.XPlot.enable_blitting`
+                (much faster than a full redraw for repeated updates).
 
         Returns:
             changed artists
@@ -315,12 +430,46 @@ class FloorPlot(XPlot):
             NAME = get(survey, "name")
             BEND = get(survey, "angle")
 
+            # fetch optional survey columns and element objects once
+            DRIFT_LENGTH = get(survey, "drift_length", None)
+            SURVEY_ORDER = get(survey, "order", None)
+            SURVEY_LENGTH = get(survey, "length", None)
+
+            # cache element objects and isthick flags per (survey, line) identity,
+            # holding the objects themselves so their ids stay valid
+            cached = self._element_cache
+            if cached is None or cached[0] is not survey or cached[1] is not line:
+                elements = [
+                    line.element_dict.get(name) if line is not None else None for name in NAME
+                ]
+                is_thick_arr = np.array(
+                    [getattr(el, "isthick", False) for el in elements], dtype=bool
+                )
+                self._element_cache = (survey, line, elements, is_thick_arr)
+            _, _, elements, IS_THICK = self._element_cache
+
+            # vectorized per-element geometry
+            # helicity: sign of the last non-zero bending angle (initially 1),
+            # not counting ignored elements
+            HELICITY = np.sign(BEND).astype(float)
+            if self.ignore is not None:
+                HELICITY[[bool(self.ignore.match(name)) for name in NAME]] = 0
+            last_bend = np.maximum.accumulate(
+                np.where(HELICITY != 0, np.arange(HELICITY.size), -1)
+            )
+            HELICITY = np.where(last_bend < 0, 1.0, HELICITY[np.maximum(last_bend, 0)])
+            # rr: angle of radial direction (outward) in axis coords
+            RR = ang(R - BEND / 2 + HELICITY * np.pi / 2)
+            COS_RR, SIN_RR = np.cos(RR), np.sin(RR)
+            BOX_ANGLE = np.rad2deg(ang(R - BEND / 2)) - 90
+
             # beam line
             ############
             self.artist_beamline.set_data(X, Y)
             changed.append(self.artist_beamline)
-            # start point arrow
-            i = np.argmax((X > X[0]) | (Y > Y[0]))
+            # start point arrow: first index where the beamline moves
+            # (short-circuits immediately rather than scanning the full arrays)
+            i = next((k for k in range(1, len(X)) if X[k] > X[0] or Y[k] > Y[0]), 0)
             self.artist_startpoint.set_positions((2 * X[0] - X[i], 2 * Y[0] - Y[i]), (X[0], Y[0]))
             changed.append(self.artist_startpoint)
 
@@ -330,34 +479,30 @@ class FloorPlot(XPlot):
                 # remove old artists
                 self.artists_boxes.pop().remove()
 
-            while len(self.artists_labels) > 0:
-                # remove old artists
-                self.artists_labels.pop().remove()
-
-            helicity = 1
-            legend_entries = []
+            boxes_by_label = {}
+            n_labels = 0
             for i, (x, y, rt, name, arc) in enumerate(zip(X, Y, R, NAME, BEND)):
-                drift_length = get(survey, "drift_length", None)
-                is_thick = line is not None and name in line.element_dict and line[name].isthick
-                if drift_length is not None and drift_length[i] > 0 and not is_thick:
+                is_thick = bool(IS_THICK[i])
+                if DRIFT_LENGTH is not None and DRIFT_LENGTH[i] > 0 and not is_thick:
                     continue  # skip drift spaces
-                if self.ignore is not None:
-                    if np.any([re.match(pattern, name) is not None for pattern in self.ignore]):
-                        continue  # skip ignored
-
-                helicity = np.sign(arc) or helicity
-                # rt = angle of tangential direction in data coords
-                # rr = angle of radial direction (outward) in axis coords
-                rr = ang(rt - arc / 2 + helicity * np.pi / 2)
-
-                element = line.element_dict.get(name) if line is not None else None
-                order = get(element, "order", None)
-                order = get(survey, "order", {i: order})[i]
-                if line is not None and name in line.element_dict:
-                    order = ORDER_NAMED_ELEMENTS.get(line[name].__class__.__name__, order)
-
-                length = get(element, "length", None)
-                length = get(survey, "length", {i: length})[i]
+                if self.ignore is not None and self.ignore.match(name):
+                    continue  # skip ignored
+
+                helicity = HELICITY[i]
+                rr, cos_rr, sin_rr = RR[i], COS_RR[i], SIN_RR[i]
+
+                element = elements[i]
+                order = (
+                    SURVEY_ORDER[i] if SURVEY_ORDER is not None else get(element, "order", None)
+                )
+                if element is not None:
+                    order = ORDER_NAMED_ELEMENTS.get(element.__class__.__name__, order)
+
+                length = (
+                    SURVEY_LENGTH[i]
+                    if SURVEY_LENGTH is not None
+                    else get(element, "length", None)
+                )
                 if length is not None:
                     length = length * scale
 
@@ -386,10 +531,7 @@ class FloorPlot(XPlot):
                 if box_style is not None:
                     width = box_style.pop("width", self.element_width * scale)
                     length = box_style.pop("length", 0)
-                    if box_style.get("label") in legend_entries:
-                        box_style.pop("label")  # prevent duplicate legend entries
-                    else:
-                        legend_entries.append(box_style.get("label"))
+                    label = box_style.pop("label", None)
 
                     # Handle thick elements
                     if is_thick and i + 1 < len(X):
@@ -414,8 +556,8 @@ class FloorPlot(XPlot):
                                 mpl.patches.Wedge,
                                 box_style,
                                 center=(
-                                    x - helicity * rho * np.cos(rr) / np.cos(arc / 2),
-                                    y - helicity * rho * np.sin(rr) / np.cos(arc / 2),
+                                    x - helicity * rho * cos_rr / np.cos(arc / 2),
+                                    y - helicity * rho * sin_rr / np.cos(arc / 2),
                                 ),
                                 r=rho + width / 2,
                                 width=width,
@@ -437,15 +579,13 @@ class FloorPlot(XPlot):
                                 xy=(x - width / 2, y - length / 2),
                                 width=width,
                                 height=length or (0.1 * scale),
-                                angle=np.rad2deg(ang(rt - arc / 2)) - 90,
+                                angle=BOX_ANGLE[i],
                                 rotation_point="center",
                                 alpha=0.5,
                                 zorder=3,
                             )
                         )
-                    self.ax.add_patch(box)
-                    self.artists_boxes.append(box)
-                    changed.append(box)
+                    boxes_by_label.setdefault(label, []).append(box)
 
                 # label
                 ########
@@ -458,39 +598,86 @@ class FloorPlot(XPlot):
                 if label_style is not None:
                     width = label_style.pop("width", self.element_width * scale)
                     label_style["text"] = label_style["text"].format(name=name, element=element)
+                    label_style = defaults_for(
+                        "text",
+                        label_style,
+                        va={1: "bottom", 0: "center", -1: "top"}[np.round(sin_rr)],
+                        ha={1: "left", 0: "center", -1: "right"}[np.round(cos_rr)],
+                        # rotation=(np.rad2deg(rr)+90)%180-90,
+                        clip_on=True,
+                        zorder=5,
+                    )
+                    xytext = (x + 1.5 * width * cos_rr, y + 1.5 * width * sin_rr)
 
-                    label = self.ax.annotate(
-                        **defaults_for(
-                            "text",
-                            label_style,
+                    if n_labels < len(self.artists_labels):
+                        # reuse pooled annotation artist from previous update
+                        label = self.artists_labels[n_labels]
+                        label.xy = (x, y)
+                        label.set_position(xytext)
+                    else:
+                        # style is applied below so that the pristine defaults
+                        # of every key can be recorded first
+                        label = self.ax.annotate(
+                            "",
                             xy=(x, y),
-                            xytext=(x + 1.5 * width * np.cos(rr), y + 1.5 * width * np.sin(rr)),
-                            # xytext=(40*np.cos(rr), 40*np.sin(rr)),
-                            # textcoords='offset points',
-                            va={1: "bottom", 0: "center", -1: "top"}[np.round(np.sin(rr))],
-                            ha={1: "left", 0: "center", -1: "right"}[np.round(np.cos(rr))],
-                            # rotation=(np.rad2deg(rr)+90)%180-90,
+                            xytext=xytext,
                             arrowprops=dict(arrowstyle="-", color="0.5", shrinkB=5),
-                            clip_on=True,
-                            zorder=5,
                         )
-                    )
-                    self.artists_labels.append(label)
+                        self.artists_labels.append(label)
+                        self._label_pristine_styles.append({})
+                    # reset keys styled by a previous occupant of this slot but not
+                    # present in the new style, so custom styles do not leak between
+                    # elements when the pool is reused
+                    pristine = self._label_pristine_styles[n_labels]
+                    props = label.properties()
+                    for key in label_style:
+                        if key not in pristine and key in props:
+                            pristine[key] = props[key]
+                    reset = {k: v for k, v in pristine.items() if k not in label_style}
+                    label.set(visible=True, **reset, **label_style)
+                    n_labels += 1
+                    changed.append(label)
+
+            # hide pooled annotations not used by this update
+            for label in self.artists_labels[n_labels:]:
+                if label.get_visible():
+                    label.set(visible=False)
                     changed.append(label)
 
+            # batch boxes into one PatchCollection per legend entry to keep the
+            # artist count (and thereby rendering time) low
+            for label, patches in boxes_by_label.items():
+                collection = mpl.collections.PatchCollection(
+                    patches, match_original=True, zorder=patches[0].get_zorder(), label=label
+                )
+                self.ax.add_collection(collection)
+                self.artists_boxes.append(collection)
+                changed.append(collection)
+
             if autoscale:
                 self.ax.relim()
                 datalim = self.ax.dataLim
                 self.fig.canvas.draw()  # required to get window extend
                 for artist in self.artists_boxes + self.artists_labels:
-                    bbox = artist.get_window_extent()
-                    datalim = mpl.transforms.Bbox.union(
-                        (datalim, bbox.transformed(self.ax.transData.inverted()))
-                    )
+                    if not artist.get_visible():
+                        continue
+                    if isinstance(artist, mpl.collections.Collection):
+                        # collections report a null window extent without a renderer
+                        bbox = artist.get_datalim(self.ax.transData)
+                    else:
+                        bbox = artist.get_window_extent().transformed(
+                            self.ax.transData.inverted()
+                        )
+                    if not np.all(np.isfinite(bbox.get_points())):
+                        continue  # empty bbox, would poison the union with nan
+                    datalim = mpl.transforms.Bbox.union((datalim, bbox))
 
                 self.ax.update_datalim(datalim)
                 self.ax.autoscale()
 
+        if blit:
+            self.blit(changed)
+
         return changed
 
     def legend(self, **kwargs):
@@ -525,7 +712,7 @@ class FloorPlot(XPlot):
 
     @staticmethod
     def _get_config(config, name, **default):
-        if isinstance(config, str):
+        if isinstance(config, (str, re.Pattern)):
             if re.match(config, name):
                 return default
         elif isinstance(config, dict):
@@ -17,7 +17,41 @@ import pint
 
 from .base import XManifoldPlot
 from .properties import Property, DerivedProperty, find_property
-from .util import c0, get, val, defaults, normalized_coordinates, ieee_mod, defaults_for
+from .util import (
+    c0,
+    get,
+    val,
+    defaults,
+    normalized_coordinates,
+    ieee_mod,
+    defaults_for,
+    index_mask,
+)
+
+
+# built once at import time: constructing these validates pint units, which is
+# too costly to repeat on every plot instantiation
+_HISTOGRAM_PARTICLE_PROPERTIES = dict(
+    count=Property("$N$", "1", description="Particles per bin"),
+    cumulative=Property("$N$", "1", description="Particles (cumulative)"),
+    rate=Property("$\\dot{N}$", "1/s", description="Particle rate"),
+    charge=Property("$Q$", find_property("q").unit, description="Charge per bin"),
+    current=Property("$I$", f"({find_property('q').unit})/s", description="Current"),
+)
+
+
+def _action(X, Px):
+    """Compute action J = (X² + Px²)/2 with minimal temporary arrays"""
+    J = np.square(X)
+    J += np.square(Px)
+    J *= 0.5
+    return J
+
+
+def _angle(X, Px):
+    """Compute angle Θ = -atan2(Px, X) with minimal temporary arrays"""
+    theta = np.arctan2(Px, X)
+    return np.negative(theta, out=theta)
 
 
 class ParticlePlotMixin:
@@ -26,6 +60,11 @@ class ParticlePlotMixin:
     .. automethod:: _init_particle_mixin
     """
 
+    #: Optional dtype to cast plotted data to (e.g. np.float32 to halve memory
+    #: bandwidth for display purposes). None keeps the native dtype, which is
+    #: required for exactness of e.g. absolute times or large turn numbers.
+    _out_dtype = None
+
     def _init_particle_mixin(
         self, *, twiss=None, beta=None, frev=None, circumference=None, **kwargs
     ):
@@ -63,20 +102,22 @@ class ParticlePlotMixin:
         self._beta = val(beta)
         self._frev = val(frev)
         self._circumference = val(circumference)
+        self._beta_cache = None
+        self._norm_coord_cache = {}
 
         # Particle specific properties
         # fmt: off
         self._derived_particle_properties = dict(
             zeta_wrapped=DerivedProperty("$\\zeta$", "m", lambda zeta: ieee_mod(zeta, self.circumference)),
-            X=DerivedProperty("$X$", "m^(1/2)", lambda x, px, delta: normalized_coordinates(x, px, self.twiss, "x", delta)[0]),
-            Y=DerivedProperty("$Y$", "m^(1/2)", lambda y, py, delta: normalized_coordinates(y, py, self.twiss, "y", delta)[0]),
-            Px=DerivedProperty("$X'$", "m^(1/2)", lambda x, px, delta: normalized_coordinates(x, px, self.twiss, "x", delta)[1]),
-            Py=DerivedProperty("$Y'$", "m^(1/2)", lambda y, py, delta: normalized_coordinates(y, py, self.twiss, "y", delta)[1]),
-            Jx=DerivedProperty("$J_x$", "m", lambda X, Px: (X**2 + Px**2) / 2),
-            Jy=DerivedProperty("$J_y$", "m", lambda Y, Py: (Y**2 + Py**2) / 2),
-            Θx=DerivedProperty("$Θ_x$", "rad", lambda X, Px: -np.arctan2(Px, X)),
-            Θy=DerivedProperty("$Θ_y$", "rad", lambda Y, Py: -np.arctan2(Py, Y)),
-            t=DerivedProperty("$t$", "s", lambda _data, at_turn, zeta: self._particle_time(at_turn, zeta, _data))
+            X=DerivedProperty("$X$", "m^(1/2)", lambda x, px, delta: self._normalized_pair(x, px, "x", delta)[0]),
+            Y=DerivedProperty("$Y$", "m^(1/2)", lambda y, py, delta: self._normalized_pair(y, py, "y", delta)[0]),
+            Px=DerivedProperty("$X'$", "m^(1/2)", lambda x, px, delta: self._normalized_pair(x, px, "x", delta)[1]),
+            Py=DerivedProperty("$Y'$", "m^(1/2)", lambda y, py, delta: self._normalized_pair(y, py, "y", delta)[1]),
+            Jx=DerivedProperty("$J_x$", "m", lambda X, Px: _action(X, Px)),
+            Jy=DerivedProperty("$J_y$", "m", lambda Y, Py: _action(Y, Py)),
+            Θx=DerivedProperty("$Θ_x$", "rad", lambda X, Px: _angle(X, Px)),
+            Θy=DerivedProperty("$Θ_y$", "rad", lambda Y, Py: _angle(Y, Py)),
+            t=DerivedProperty("$t$", "s", lambda _data, _mask: self._particle_time_lazy(_data, _mask))
         )
         # fmt: on
 
@@ -113,15 +154,24 @@ class ParticlePlotMixin:
             if self.twiss is not None:
                 return self.circumference / self.twiss.T_rev0 / c0
         if particles is not None:
+            # memoize the O(N) beta0 scan; holding the particles object itself keeps
+            # its id valid for the identity check (single entry, no unbounded growth)
+            cached = self._beta_cache
+            if cached is not None and cached[0] is particles:
+                return cached[1]
             try:
                 beta = get(particles, "beta0")
                 if np.size(beta) > 1:
                     mean_beta = np.mean(beta)
-                    if not np.allclose(beta, mean_beta):
+                    # same criterion as np.allclose(beta, mean_beta), but via min/max
+                    # so no boolean temporary is allocated
+                    deviation = max(np.max(beta) - mean_beta, mean_beta - np.min(beta))
+                    if deviation > 1e-8 + 1e-5 * abs(mean_beta):
                         raise ValueError(
                             "Particle beta0 is not constant. Please specify beta in constructor!"
                         )
                     beta = mean_beta
+                self._beta_cache = (particles, beta)
                 return beta
             except:
                 pass
@@ -136,6 +186,23 @@ class ParticlePlotMixin:
         if beta is not None and self.circumference is not None:
             return beta * c0 / self.circumference
 
+    def _particle_time_lazy(self, particles, mask=None):
+        """Particle arrival time, fetching longitudinal data only when required"""
+
+        # use time directly (if available), skipping the at_turn/zeta fetches entirely
+        # (those can be expensive, e.g. a device-to-host copy for GPU-backed particles)
+        try:
+            return get(particles, "t")
+        except AttributeError:
+            pass
+
+        # resolve via the plot's property system if available (standalone mixin
+        # use, e.g. TimeBinMetricHelper, falls back to get_property)
+        resolve = getattr(self, "prop", self.get_property)
+        turn = resolve("at_turn").values(particles, mask)
+        zeta = resolve("zeta").values(particles, mask)
+        return self._particle_time(turn, zeta, particles)
+
     def _particle_time(self, turn, zeta, particles=None):
         """Particle arrival time (t = at_turn / frev - zeta / beta / c0)"""
 
@@ -157,20 +224,79 @@ class ParticlePlotMixin:
                 "or specify particle.beta0."
             )
 
-        time = -zeta / beta / c0  # zeta>0 means early; zeta<0 means late
-        if np.any(turn != 0):
-            frev = self.frev(particles)
-            if frev is None:
-                raise ValueError(
-                    "Particle arrival time can not be determined while at_turn > 0 "
-                    "because all of the following are unknown: "
-                    "frev, twiss, (bata and circumference). "
-                    "To resolve this error, pass either to the plot constructor "
-                    "and/or specify particle.beta0."
-                )
-            time = time + turn / frev
-
-        return np.array(time)
+        # zeta>0 means early; zeta<0 means late
+        time = np.asarray(zeta) * (-1.0 / (beta * c0))  # single fused multiply
+        frev = self.frev(particles)
+        if frev is not None:
+            # add the turn term unconditionally rather than scanning at_turn first;
+            # for single-turn data it is all zeros and the add is a no-op
+            time += np.asarray(turn) * (1.0 / frev)
+        elif np.any(turn):  # avoids the boolean temporary of np.any(turn != 0)
+            raise ValueError(
+                "Particle arrival time can not be determined while at_turn > 0 "
+                "because all of the following are unknown: "
+                "frev, twiss, (bata and circumference). "
+                "To resolve this error, pass either to the plot constructor "
+                "and/or specify particle.beta0."
+            )
+
+        return np.asarray(time)
+
+    def _normalized_pair(self, coord, momentum, xy, delta):
+        """Get both normalized coordinates of a plane, computing them only once
+
+        The last result per plane is kept and reused when the same input arrays are
+        passed again (compared by identity), so that e.g. requesting X and Px — or J
+        and Θ, which depend on both — performs the normalization a single time.
+
+        Args:
+            coord (np.ndarray): Coordinate values, i.e. x or y
+            momentum (np.ndarray): Momentum values, i.e. px or py
+            xy (str): Plane, either "x" or "y"
+            delta (np.ndarray): Momentum deviation values
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The normalized coordinates (X, Px)
+        """
+        cached = self._norm_coord_cache.get(xy)
+        if cached is not None:
+            c, m, d, pair = cached
+            if c is coord and m is momentum and d is delta:
+                return pair
+        pair = normalized_coordinates(coord, momentum, self.twiss, xy, delta)
+        # keep references to the inputs so their ids stay valid for the identity check
+        self._norm_coord_cache[xy] = (coord, momentum, delta, pair)
+        return pair
+
+    def _memoized_prop_resolver(self):
+        """Create a property resolver which memoizes values for the duration of one update
+
+        Since the returned properties share a common cache and resolve their dependencies
+        through it, each raw data column is read once and each derived property (such as the
+        normalized coordinates) is computed once, no matter how many axes request it.
+
+        Returns:
+            Callable: A resolver with the same signature as :meth:`~.base.XPlot.prop`
+        """
+        properties = {}
+        cache = {}
+
+        def resolver(name):
+            if name not in properties:
+                p = self.prop(name).with_property_resolver(resolver)
+                values = p.values
+
+                def cached_values(data, mask=None, *, unit=None, _name=name, _values=values):
+                    key = (_name, unit)
+                    if key not in cache:
+                        cache[key] = _values(data, mask, unit=unit)
+                    return cache[key]
+
+                p.values = cached_values
+                properties[name] = p
+            return properties[name]
+
+        return resolver
 
     def get_property(self, name):
         # Note: this method is not used by the library, but it's handy for standalone use
@@ -202,13 +328,7 @@ class ParticleHistogramPlotMixin:
 
         """
 
-        self._histogram_particle_properties = dict(
-            count=Property("$N$", "1", description="Particles per bin"),
-            cumulative=Property("$N$", "1", description="Particles (cumulative)"),
-            rate=Property("$\\dot{N}$", "1/s", description="Particle rate"),
-            charge=Property("$Q$", find_property("q").unit, description="Charge per bin"),
-            current=Property("$I$", f"({find_property('q').unit})/s", description="Current"),
-        )
+        self._histogram_particle_properties = _HISTOGRAM_PARTICLE_PROPERTIES
 
         # Update kwargs with particle specific settings
         kwargs["_properties"] = defaults(
@@ -276,6 +396,17 @@ class ParticlesPlot(XManifoldPlot, ParticlePlotMixin):
 
         self._create_artists(create_artists)
 
+        # flat iteration plan so update does not re-walk the nested on_y structure
+        self._update_plan = [
+            (self.artists[i][j][k], p)
+            for i, ppp in enumerate(self.on_y)
+            for j, pp in enumerate(ppp)
+            for k, p in enumerate(pp)
+        ]
+        self._subplot_axes = [
+            self.axis(i, j) for i, ppp in enumerate(self.on_y) for j in range(len(ppp))
+        ]
+
         # set data
         if particles is not None:
             self.update(particles, mask=mask, autoscale=True)
@@ -292,27 +423,37 @@ class ParticlesPlot(XManifoldPlot, ParticlePlotMixin):
             List of artists that have been updated.
         """
 
-        xdata = self.prop(self.on_x).values(
-            particles, mask, unit=self.display_unit_for(self.on_x)
-        )
-        order = np.argsort(
-            xdata if self.sort_by is None else self.prop(self.sort_by).values(particles, mask)
-        )
-        xdata = xdata[order]
+        # memoize property values and unit lookups so shared work is only done once
+        mask = index_mask(mask)  # convert boolean masks once, then reuse
+        prop = self._memoized_prop_resolver()
+        display_units = {}
+
+        def display_unit(p):
+            if p not in display_units:
+                display_units[p] = self.display_unit_for(p)
+            return display_units[p]
+
+        xdata = prop(self.on_x).values(particles, mask, unit=display_unit(self.on_x))
+        sort_data = xdata if self.sort_by is None else prop(self.sort_by).values(particles, mask)
+        # for integer keys like at_turn, a stable (radix) sort beats the default quicksort
+        order = np.argsort(sort_data, kind="stable" if sort_data.dtype.kind in "iu" else None)
+        xdata = np.take(xdata, order)
+        if self._out_dtype is not None:
+            xdata = xdata.astype(self._out_dtype, copy=False)
 
         changed = []
-        for i, ppp in enumerate(self.on_y):
-            for j, pp in enumerate(ppp):
-                for k, p in enumerate(pp):
-                    values = self.prop(p).values(particles, mask, unit=self.display_unit_for(p))
-                    values = values[order]
-                    self.artists[i][j][k].set_data((xdata, values))
-                    changed.append(self.artists[i][j][k])
-
-                if autoscale:
-                    a = self.axis(i, j)
-                    a.relim()
-                    a.autoscale()
+        for artist, p in self._update_plan:
+            values = prop(p).values(particles, mask, unit=display_unit(p))
+            values = np.take(values, order)  # faster than values[order]
+            if self._out_dtype is not None:
+                values = values.astype(self._out_dtype, copy=False)
+            artist.set_data(xdata, values)
+            changed.append(artist)
+
+        if autoscale:
+            for a in self._subplot_axes:
+                a.relim()
+                a.autoscale()
 
         return changed
 
@@ -18,7 +18,15 @@ from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
 from .base import XPlot, XManifoldPlot, AngleLocator, RadiansFormatter
 from .particles import ParticlePlotMixin
-from .util import get, defaults, normalized_coordinates, denormalized_coordinates, defaults_for
+from .util import (
+    get,
+    defaults,
+    normalized_coordinates,
+    denormalized_coordinates,
+    defaults_for,
+    index_mask,
+    padded_steps,
+)
 
 pairwise = np.c_
 
@@ -314,13 +322,18 @@ class PhaseSpacePlot(XPlot, ParticlePlotMixin):
             raise ValueError("Only one of mask and masks can be set.")
         if len(masks) != len(self.kind):
             raise ValueError(f"masks must be a list of length {len(self.kind)}")
+        masks = [index_mask(m) for m in masks]  # convert boolean masks once, then reuse
 
         changed_artists = []
 
         for i, ((a, b), c, ax) in enumerate(zip(self.kind, self.color, self.axflat)):
+            # memoize values per subplot (masks may differ between subplots) so raw
+            # columns shared between the properties of this subplot are read once
+            prop = self._memoized_prop_resolver()
+
             # coordinates
-            x = self.prop(a).values(particles, masks[i], unit=self.display_unit_for(a))
-            y = self.prop(b).values(particles, masks[i], unit=self.display_unit_for(b))
+            x = prop(a).values(particles, masks[i], unit=self.display_unit_for(a))
+            y = prop(b).values(particles, masks[i], unit=self.display_unit_for(b))
 
             # statistics
             XY = np.array((x, y))
@@ -341,7 +354,7 @@ class PhaseSpacePlot(XPlot, ParticlePlotMixin):
                 scatter.set_visible(True)
                 scatter.set_offsets(pairwise[x, y])
                 if c is not None:
-                    v = self.prop(c).values(particles, masks[i], unit=self.display_unit_for(c))
+                    v = prop(c).values(particles, masks[i], unit=self.display_unit_for(c))
                     if autoscale:
                         # scatter.set_clim(np.min(v), np.max(v)) # sometimes leaves behind black dots (bug?)
                         # scatter.norm = mpl.colors.Normalize(np.min(v), np.max(v)) # works, but resets colorbar locator/formatter
@@ -435,7 +448,7 @@ class PhaseSpacePlot(XPlot, ParticlePlotMixin):
                         counts, edges = np.histogram(v, bins=101, range=rng)
                         counts = counts / len(v)
 
-                        steps = (np.append(edges, edges[-1]), np.concatenate(([0], counts, [0])))
+                        steps = padded_steps(edges, counts)
                         hist.set_data(steps if xy == "x" else steps[::-1])
                         changed_artists.append(hist)
 
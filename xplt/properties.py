@@ -129,23 +129,26 @@ class DataProperty(Property):
         v = get(data, self.key)
 
         # apply mask
-        v = np.array(v)
+        v = np.asarray(v)
         if v.ndim > 0:
             if callable(mask):
-                v = v.flatten()
+                v = v.ravel()
                 mask = mask(
                     np.ones_like(v, dtype="bool"), lambda key: self.prop(key).values(data)
                 )
             if mask is not None:
-                v = v[mask]
+                if isinstance(mask, np.ndarray) and mask.dtype.kind in "iu":
+                    v = np.take(v, mask)  # faster than fancy indexing for index arrays
+                else:
+                    v = v[mask]
 
-        # flatten
-        v = v.flatten()
+        # flatten (a view where possible, since the source data must not be modified)
+        v = np.ravel(v)
 
         # convert to unit
         if unit is not None:
             factor = pint.Quantity(1, self.unit).to(unit).magnitude
-            v *= factor
+            v = v * factor  # not in-place, v might be a view on the data
 
         return v
 
@@ -163,6 +166,8 @@ class DerivedProperty(Property):
         """
         super().__init__(symbol, unit, description)
         self.evaluate = evaluate
+        # dependency names are static, avoid the costly signature inspection per call
+        self._dependents = tuple(inspect.signature(evaluate).parameters)
 
     def with_property_resolver(self, resolver):
         p = self.__class__(self.symbol, self.unit, self.evaluate, self.description)
@@ -177,24 +182,26 @@ class DerivedProperty(Property):
         """
 
         # determine dependencies
-        dependents = inspect.signature(self.evaluate).parameters.keys()
+        dependents = self._dependents
 
         # collect dependencies
         dv = {}
         for d in dependents:
             if d == "_data":  # special parameter to request raw data object
                 dv[d] = data
+            elif d == "_mask":  # special parameter to request the mask
+                dv[d] = mask
             else:
                 p = self.prop(d)
                 dv[d] = p.values(data, mask=mask)
 
         # evaluate
-        v = np.array(self.evaluate(**dv))
+        v = np.asarray(self.evaluate(**dv))
 
         # convert to unit
         if unit is not None:
             factor = pint.Quantity(1, self.unit).to(unit).magnitude
-            v *= factor
+            v = v * factor  # not in-place, v might be a view on the data
 
         return v
 
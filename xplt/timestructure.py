@@ -14,6 +14,7 @@ import types
 import matplotlib as mpl
 import numpy as np
 import pint
+import scipy.fft
 
 from .util import *
 from .base import XManifoldPlot, TwinFunctionLocator, TransformedLocator
@@ -175,8 +176,14 @@ class TimeBinPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
         """
 
         # extract times
-        t_prop = self.prop(self.on_x)
-        times = t_prop.values(particles, mask, unit="s")
+        mask = index_mask(mask)  # convert boolean masks once, then reuse
+        prop = self._memoized_prop_resolver()  # fetch each property once per update
+        times = prop(self.on_x).values(particles, mask, unit="s")
+
+        # scan the extent once instead of once per trace
+        v_range = self.time_range
+        if v_range is None:
+            v_range = (np.min(times), np.max(times))
 
         # update plots
         changed = []
@@ -187,36 +194,41 @@ class TimeBinPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
                 for k, p in enumerate(pp):
                     count_based = self._count_based(p)
                     if p in ("current", "charge"):
-                        property = self.prop("q").values(particles, mask)
+                        property = prop("q").values(particles, mask)
                     elif count_based:
                         property = None
                     else:
-                        property = self.prop(p).values(particles, mask)
+                        property = prop(p).values(particles, mask)
 
                     t_min, dt, timeseries = binned_data(
                         times,
                         what=property,
                         n=self.bin_count,
                         dv=self.bin_time,
-                        v_range=self.time_range,
+                        v_range=v_range,
                         moments=None if count_based else self.moment,
                     )
-                    timeseries = timeseries.astype(np.float64)
-                    edges = np.linspace(t_min, t_min + dt * timeseries.size, timeseries.size + 1)
+                    # no-op for the weighted path, which is float64 already
+                    timeseries = timeseries.astype(np.float64, copy=False)
+                    # arange is measurably faster than linspace for a uniform grid
+                    edges = t_min + dt * np.arange(timeseries.size + 1)
 
                     self.annotate(
                         f'$\\Delta t_\\mathrm{{bin}} = {pint.Quantity(dt, "s"):#~.4gL}$'
                     )
 
+                    # fold scalar scalings into a single pass over the bins
+                    scale = 1.0
                     if self.relative:
                         if not count_based:
                             raise ValueError(
                                 "Relative plots are only supported for kind 'count', 'rate', 'cumulative', 'charge' or 'current'."
                             )
-                        timeseries /= len(times)
-
+                        scale /= len(times)
                     if p in ("rate", "current"):
-                        timeseries /= dt
+                        scale /= dt
+                    if scale != 1.0:
+                        timeseries *= scale
 
                     # post-processing expression wrappers
                     if wrap := self.on_y_expression[i][j][k]:
@@ -232,8 +244,7 @@ class TimeBinPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
                         timeseries = np.concatenate(([0], np.cumsum(timeseries)))
                     elif count_based:
                         # steps go back to zero after last bin
-                        edges = np.append(edges, edges[-1])
-                        timeseries = np.concatenate(([0], timeseries, [0]))
+                        edges, timeseries = padded_steps(edges, timeseries)
                     else:
                         edges = (edges[1:] + edges[:-1]) / 2
                     self.artists[i][j][k].set_data((edges, timeseries))
@@ -246,7 +257,8 @@ class TimeBinPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
                     if count_based:
                         a.set(ylim=(0, None))
                     if self.time_range is not None and edges is not None:
-                        a.set(xlim=(min(edges), max(edges)))
+                        # edges are sorted, the limits are just the endpoints
+                        a.set(xlim=(edges[0], edges[-1]))
 
         return changed
 
@@ -404,23 +416,34 @@ class TimeFFTPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
                 )
 
             # extract times
+            mask = index_mask(mask)  # convert boolean masks once, then reuse
             times = self.prop("t").values(particles, mask, unit="s")
             fmax = self.fmax(particles)
             ppscale = len(times)
 
             # compute binned timeseries
+            # scan the time range once instead of once per kind inside binned_data
+            v_range = self.time_range
+            if v_range is None:
+                v_range = (np.min(times), np.max(times))
             timeseries, timeseries_fs = {}, {}
+            counts = None  # all count-based kinds share the same binning
             for p in self.on_y_unique:
-                prop = self.prop(p)
-                property = None if self._count_based(p) else prop.values(particles, mask)
-                # to improve FFT performance, round up to next power of 2
-                _, dt, ts = binned_data(
-                    times,
-                    what=property,
-                    dv=1 / (2 * fmax),
-                    v_range=self.time_range,
-                    make_n_power_of_two=True,
-                )
+                if self._count_based(p) and counts is not None:
+                    ts = counts
+                else:
+                    count_based = self._count_based(p)
+                    property = None if count_based else self.prop(p).values(particles, mask)
+                    # to improve FFT performance, round up to the next fast FFT length
+                    _, dt, ts = binned_data(
+                        times,
+                        what=property,
+                        dv=1 / (2 * fmax),
+                        v_range=v_range,
+                        make_n_fast=True,
+                    )
+                    if count_based:
+                        counts = ts
                 timeseries[p] = ts
                 timeseries_fs[p] = 1 / dt
 
@@ -450,32 +473,46 @@ class TimeFFTPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMixin):
 
         # update plots
         changed = []
+        fft_cache = {}  # the same series may be shown in several subplots
         for i, ppp in enumerate(self.on_y):
             for j, pp in enumerate(ppp):
                 for k, p in enumerate(pp):
 
                     # calculate fft without DC component
                     dt, ts = 1 / get(timeseries_fs, p), get(timeseries, p)
-                    freq = np.fft.rfftfreq(ts.size, d=dt)[1:]
-                    mag = np.abs(np.fft.rfft(ts))[1:]
+                    if p in fft_cache:
+                        freq, fft = fft_cache[p]
+                    else:
+                        freq = scipy.fft.rfftfreq(ts.size, d=dt)[1:]
+                        # scipy's pocketfft can use all cores, unlike np.fft
+                        fft = scipy.fft.rfft(ts, workers=-1)[1:]
+                        fft_cache[p] = freq, fft
 
                     # scale frequency according to user preferences
+                    # (not in-place, the cached array must stay unscaled)
                     if self.relative:
-                        freq *= 1 / self.frev(particles)
+                        freq = freq * (1 / self.frev(particles))
                     else:
-                        freq *= self.factor_for("f")
+                        freq = freq * self.factor_for("f")
 
                     # scale magnitude according to user preference
-                    if p == "rate":
-                        mag /= dt
-                    if self._get_scaling(p) == "amplitude":
-                        # amplitude in units of p
-                        mag *= 2 / len(ts) * self.factor_for(p)
-                    elif self._get_scaling(p) in ("pds", "pdspp"):
+                    scaling = self._get_scaling(p)
+                    if scaling in ("pds", "pdspp"):
                         # power density spectrum in arb. unit
-                        mag = mag**2
-                        if self._get_scaling(p) == "pdspp":
+                        # |F|^2 from the components directly, skipping the sqrt of np.abs
+                        mag = np.square(fft.real)
+                        mag += np.square(fft.imag)
+                        if p == "rate":
+                            mag /= dt * dt
+                        if scaling == "pdspp":
                             mag /= ppscale  # per particle
+                    else:
+                        mag = np.abs(fft)
+                        if p == "rate":
+                            mag /= dt
+                        if scaling == "amplitude":
+                            # amplitude in units of p
+                            mag *= 2 / len(ts) * self.factor_for(p)
 
                     # cut data above fmax which was only added to increase FFT performance
                     visible = freq <= fmax
@@ -694,15 +731,19 @@ class TimeIntervalPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMi
         """
 
         # extract times
+        mask = index_mask(mask)  # convert boolean masks once, then reuse
         times = self.prop("t").values(particles, mask, unit="s")
         if self.time_range:
             times = times[(self.time_range[0] <= times) & (times < self.time_range[1])]
-        delay = self.factor_for("t") * np.diff(sorted(times))
+        # np.sort stays in C; sorted() would round-trip through a Python list
+        delay = np.diff(np.sort(times))
+        delay *= self.factor_for("t")  # in-place, diff already allocated a fresh array
 
         self.annotate(f"$\\Delta t_\\mathrm{{bin}} = {pint.Quantity(self.bin_time, 's'):#~.4gL}$")
 
         # update plots
         changed = []
+        rate = None  # computed on demand, once
         for i, ppp in enumerate(self.on_y):
             for j, pp in enumerate(ppp):
                 edges = None
@@ -714,14 +755,17 @@ class TimeIntervalPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMi
                     else:
                         raise NotImplementedError()
 
-                    # calculate histogram
-                    counts, edges = np.histogram(
-                        delay,
-                        bins=self.bin_count,
-                        range=(0, self.bin_count * self.bin_time),
-                        weights=weights,
-                    )
-                    counts = counts.astype(np.float)
+                    # calculate histogram (binned_data is much faster than np.histogram)
+                    nbins = self.bin_count
+                    v_range = (0, nbins * self.bin_time)
+                    if weights is None:
+                        t0, dt, counts = binned_data(delay, n=nbins, v_range=v_range)
+                    else:
+                        t0, dt, counts = binned_data(
+                            delay, what=weights, moments=None, n=nbins, v_range=v_range
+                        )
+                    edges = t0 + dt * np.arange(nbins + 1)
+                    counts = counts.astype(float, copy=False)
                     if p in ("rate", "current"):
                         counts /= self.bin_time
                     if self.relative:
@@ -735,8 +779,7 @@ class TimeIntervalPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMi
                         counts = np.concatenate(([0], np.cumsum(counts)))
                     elif self._count_based(p):
                         # steps go back to zero after last bin
-                        edges = np.append(edges, edges[-1])
-                        counts = np.concatenate(([0], counts, [0]))
+                        edges, counts = padded_steps(edges, counts)
                     else:
                         raise NotImplementedError()
                     plot.set_data((edges, counts))
@@ -744,7 +787,8 @@ class TimeIntervalPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMi
 
                     # poisson limit
                     if pplot:
-                        rate = times.size / (np.max(times) - np.min(times))
+                        if rate is None:
+                            rate = times.size / (np.max(times) - np.min(times))
                         if p == "cumulative":
                             limit = 1 - np.exp(-rate * edges)
                             limit *= np.max(counts)
@@ -763,7 +807,8 @@ class TimeIntervalPlot(XManifoldPlot, ParticlePlotMixin, ParticleHistogramPlotMi
                     if edges is not None:
                         e = edges[edges > 0] if ax.get_xscale() == "log" else edges
                         if e.size > 1:
-                            ax.set(xlim=(min(e), max(e)))
+                            # edges are sorted, the limits are just the endpoints
+                            ax.set(xlim=(e[0], e[-1]))
 
         return changed
 
@@ -805,18 +850,37 @@ class MetricesMixin:
     )
 
     @staticmethod
-    def _calculate_metric(N, metric, axis=None):
-        """Calculate the metric over the array N"""
-        if metric == "cv":
-            Cv = np.std(N, axis=axis) / np.mean(N, axis=axis)
-            Cv_poisson = 1 / np.mean(N, axis=axis) ** 0.5
-            return Cv, Cv_poisson
-        elif metric == "duty":
-            F = np.mean(N, axis=axis) ** 2 / np.mean(N**2, axis=axis)
-            F_poisson = 1 / (1 + 1 / np.mean(N, axis=axis))
+    def _calculate_metric(N, metric, axis=None, N_sq=None):
+        """Calculate the metric over the array N
+
+        Args:
+            N (np.ndarray): Particle counts
+            metric (str): The metric to calculate
+            axis (int | None): Axis to reduce over
+            N_sq (np.ndarray | None): Optional precomputed elementwise square of N.
+                Useful when N is a strided view with overlapping elements.
+        """
+        mean = np.mean(N, axis=axis)  # shared by all metrics and their poisson limits
+        if metric in ("cv", "duty"):
+            # second moment, fused into a single pass without an N*N temporary
+            # (exact for integer counts, whose squares are representable in float64)
+            if N_sq is not None:
+                msq = np.mean(N_sq, axis=axis)
+            elif N.ndim == 2 and axis == 1:
+                msq = np.einsum("ij,ij->i", N, N) / N.shape[1]
+            else:
+                msq = np.mean(N * N, axis=axis)
+            if metric == "cv":
+                var = msq - mean**2
+                var = np.maximum(var, 0)  # guard against round-off for zero variance
+                Cv = np.sqrt(var) / mean
+                Cv_poisson = mean**-0.5
+                return Cv, Cv_poisson
+            F = mean**2 / msq
+            F_poisson = mean / (mean + 1)
             return F, F_poisson
         elif metric == "maxmean":
-            M = np.max(N, axis=axis) / np.mean(N, axis=axis)
+            M = np.max(N, axis=axis) / mean
             return M, np.nan * np.empty_like(M)
         else:
             raise ValueError(f"Unknown metric {metric}")
@@ -1059,47 +1123,64 @@ class TimeVariationPlot(XManifoldPlot, ParticlePlotMixin, MetricesMixin):
         t_prop = self.prop(self.on_x)
         times = t_prop.values(particles, mask, unit="s")
 
+        # scan the data range once and reuse it below (each min/max is a full pass)
+        t_lo, t_hi = np.min(times), np.max(times)
+
         # re-sample times into equally binned time series
-        ncbins = self.counting_bins or int(
-            np.ceil((np.max(times) - np.min(times)) / self.counting_dt)
-        )
+        ncbins = self.counting_bins or int(np.ceil((t_hi - t_lo) / self.counting_dt))
         if self.evaluate_bins is not None:
             nebins = int(ncbins / self.evaluate_bins)
         else:
-            nebins = int(ncbins * self.evaluate_dt / (np.max(times) - np.min(times)))
+            nebins = int(ncbins * self.evaluate_dt / (t_hi - t_lo))
+        if nebins < 1:
+            # would otherwise fail with a cryptic division error in the reshape below
+            raise ValueError(
+                "Evaluation window smaller than a counting bin, "
+                "check counting_dt/counting_bins and evaluate_dt/evaluate_bins"
+            )
 
         # bin into counting bins
-        t_min, dt, counts = binned_data(times, n=ncbins, v_range=self.time_range)
-        edges = np.linspace(t_min, t_min + dt * ncbins, ncbins + 1)
+        t_min, dt, counts = binned_data(times, n=ncbins, v_range=self.time_range or (t_lo, t_hi))
 
         # make 2D array by subdividing into evaluation bins
-        N = counts[: int(len(counts) / nebins) * nebins].reshape((-1, nebins))
-        E = edges[: int(len(edges) / nebins + 1) * nebins : nebins]
+        nevals = counts.size // nebins  # integer math, no float divide and cast
+        N = counts[: nevals * nebins].reshape(nevals, nebins)
+        # evaluation bin edges, built directly instead of slicing every
+        # nebins-th element out of a full counting-bin edge array
+        E = t_min + dt * nebins * np.arange(nevals + 1)
 
         self.annotate(
             f'$\\Delta t_\\mathrm{{count}} = {pint.Quantity(dt, "s"):#~.4gL}$\n'
             f'$\\Delta t_\\mathrm{{evaluate}} = {pint.Quantity(dt*nebins, "s"):#~.4gL}$'
         )
 
-        # display units
-        edges = np.append(E, E[-1])
+        # display units (single allocation for the padded edges)
+        edges = np.empty(E.size + 1)
+        edges[:-1] = E
+        edges[-1] = E[-1]
         edges *= self.factor_for(self.on_x)
 
         # update plots
         changed = []
+        metrics = {}  # the same metric may be shown in several subplots
         for i, ppp in enumerate(self.on_y):
             for j, pp in enumerate(ppp):
                 for k, p in enumerate(pp):
                     # calculate metrics
-                    F, F_poisson = self._calculate_metric(N, p, axis=1)
+                    if p not in metrics:
+                        metrics[p] = self._calculate_metric(N, p, axis=1)
+                    F, F_poisson = metrics[p]
 
                     # update plot
                     step, pstep = self.artists[i][j][k]
-                    steps = np.concatenate(([0], F, [0]))
+                    # zero sentinels close the steps (single allocation, no concatenate)
+                    steps = np.zeros(F.size + 2)
+                    steps[1:-1] = F
                     step.set_data((edges, steps))
                     changed.append(step)
                     if pstep:
-                        steps = np.concatenate(([0], F_poisson, [0]))
+                        steps = np.zeros(F_poisson.size + 2)
+                        steps[1:-1] = F_poisson
                         pstep.set_data((edges, steps))
                         changed.append(pstep)
 
@@ -1247,11 +1328,13 @@ class TimeVariationScalePlot(XManifoldPlot, ParticlePlotMixin, MetricesMixin):
         """
 
         # extract times
+        mask = index_mask(mask)  # convert boolean masks once, then reuse
         times = self.prop("t").values(particles, mask, unit="s")
         if self.time_range:
             times = times[(self.time_range[0] <= times) & (times < self.time_range[1])]
         ntotal = times.size
-        duration = np.max(times) - np.min(times)
+        t_lo, t_hi = np.min(times), np.max(times)
+        duration = t_hi - t_lo
 
         # annotate plot
         # f'$\\langle\\dot{{N}}\\rangle = {pint.Quantity(ntotal/duration, "1/s"):#~.4gL}$\n'
@@ -1299,15 +1382,19 @@ class TimeVariationScalePlot(XManifoldPlot, ParticlePlotMixin, MetricesMixin):
         F_std = {m: np.empty_like(DT) for m in self.on_y_unique}
         F_poisson = {m: np.empty_like(DT) for m in self.on_y_unique}
         for i, nbin in enumerate(ncbins_arr):
-            _, DT[i], N = binned_data(times, n=nbin)
+            # forward the data range so binned_data need not rescan it per bin count
+            _, DT[i], N = binned_data(times, n=nbin, v_range=(t_lo, t_hi))
 
             # calculate metric on sliding window
             stride = min(self.counting_bins_per_evaluation or N.size, N.size)
+            # square once before windowing; the overlapping windows would otherwise
+            # re-square each count for every window it appears in
+            N_sq = np.lib.stride_tricks.sliding_window_view(N * N, stride)
             N = np.lib.stride_tricks.sliding_window_view(N, stride)
 
             for metric in F.keys():
                 # calculate metrics
-                v, lim = self._calculate_metric(N, metric, axis=1)
+                v, lim = self._calculate_metric(N, metric, axis=1, N_sq=N_sq)
                 F[metric][i] = np.mean(v)
                 F_std[metric][i] = np.std(v) or np.nan
                 F_poisson[metric][i] = np.mean(lim)
@@ -13,6 +13,7 @@ __date__ = "2022-11-15"
 import types
 
 import numpy as np
+import scipy.fft
 import scipy.signal
 import matplotlib as mpl
 
@@ -22,6 +23,12 @@ except ImportError:
     # pandas is an optional dependency
     pd = None
 
+try:
+    from fast_histogram import histogram1d as _fast_histogram1d
+except ImportError:
+    # fast_histogram is an optional dependency used to speed up binned_data
+    _fast_histogram1d = None
+
 
 VOID = object()
 
@@ -39,7 +46,14 @@ def val(obj):
 #
 def ieee_mod(values, m):
     """Return the IEEE remainder (in range -x/2 .. x/2)"""
-    return np.mod(values + m / 2, m) - m / 2
+    h = m / 2
+    v = np.asarray(values) + h
+    if isinstance(v, np.ndarray):
+        # the addition above made a fresh array, so wrap in place
+        np.mod(v, m, out=v)
+        v -= h
+        return v
+    return v % m - h
 
 
 def get(obj, value, default=VOID):
@@ -108,6 +122,46 @@ def defaults_for(alias_provider, kwargs, /, **default_kwargs):
     return defaults(kwargs, **default_kwargs)
 
 
+def index_mask(mask):
+    """Convert a boolean mask to integer indices
+
+    Applying an index array via np.take is faster than boolean indexing, so when the
+    same mask is used to select from several arrays, converting it once pays off.
+    Masks which are not boolean arrays (slices, index arrays, callables) pass through.
+
+    Args:
+        mask (Any): The mask to convert
+
+    Returns:
+        The converted mask
+    """
+    if isinstance(mask, np.ndarray) and mask.dtype == bool:
+        return np.flatnonzero(mask)
+    return mask
+
+
+def padded_steps(edges, values):
+    """Pad histogram data for a steps-pre plot so it closes to zero at both ends
+
+    Builds the padded arrays with a single allocation each instead of
+    np.append and np.concatenate with sentinel lists.
+
+    Args:
+        edges (np.ndarray): The n+1 bin edges
+        values (np.ndarray): The n bin values
+
+    Returns:
+        tuple: (x, y) arrays of size n+2 for use with ``drawstyle="steps-pre"``
+    """
+    x = np.empty(edges.size + 1)
+    x[:-1] = edges
+    x[-1] = edges[-1]
+    y = np.empty(values.size + 2)
+    y[0] = y[-1] = 0
+    y[1:-1] = values
+    return x, y
+
+
 def flattened(lists):
     """Flatten a list of nested lists recursively"""
     if hasattr(lists, "__iter__"):
@@ -180,7 +234,15 @@ def evaluate_expression_wrapper(expression, key, data):
 
 
 def binned_data(
-    values, *, what=None, n=None, dv=None, v_range=None, moments=1, make_n_power_of_two=False
+    values,
+    *,
+    what=None,
+    n=None,
+    dv=None,
+    v_range=None,
+    moments=1,
+    make_n_power_of_two=False,
+    make_n_fast=False,
 ):
     """Get histogrammed data with equally spaced bins
 
@@ -198,11 +260,16 @@ def binned_data(
         n (int | None): Number of bins. Must not be used together with `dv`.
         dv (float | None): Bin width. Must not be used together with n.
         v_range (tuple[float] | None): Tuple of (min, max) values to consider.
-                                       If None, the range is determined from the data.
+                                       If None, the range is determined from the data and the
+                                       maximum value is included in the last bin (like
+                                       :func:`numpy.histogram`'s closed right edge).
         what (np.ndarray | None): Array of associated data or None. Must have same shape as values. See above.
         moments (int | list[int | None] | None): The moment(s) to return for associated data if what is not None. See above.
         make_n_power_of_two (bool): If true, ensure that the number of bins is a power of two by rounding up.
                                     Useful to increase performance of calculating FFTs on the timeseries data.
+        make_n_fast (bool): If true, round the number of bins up to the next fast FFT length
+                            (see :func:`scipy.fft.next_fast_len`). Like `make_n_power_of_two`, but
+                            with considerably less padding since 5-smooth lengths are also fast.
 
     Returns:
         The histogram or timeseries as tuple (v_min, dv, *counts_or_what) where
@@ -219,12 +286,16 @@ def binned_data(
         # number of bins requested, adjust bin width accordingly
         if make_n_power_of_two:
             n = 1 << (n - 1).bit_length()
+        elif make_n_fast:
+            n = scipy.fft.next_fast_len(n, real=True)
         dv = (v_max - v_min) / n
     elif n is None and dv is not None:
         # bin width requested, adjust number of bins accordingly
         n = int(np.ceil((v_max - v_min) / dv))
         if make_n_power_of_two:
             n = 1 << (n - 1).bit_length()
+        elif make_n_fast:
+            n = scipy.fft.next_fast_len(n, real=True)
     else:
         raise ValueError(f"Exactly one of n or dt must be specified, but got n={n} and dt={dv}")
 
@@ -232,11 +303,67 @@ def binned_data(
     # np.histogram, which quickly slows down for large datasets.
     # If you intend to change something here, make sure to benchmark it!
 
-    # count timestamps in bins
-    bins = np.floor((values - v_min) / dv).astype(int)
+    if _fast_histogram1d is not None:
+        # dedicated uniform-bin C implementation, considerably faster than the code below
+        rng = (v_min, v_min + n * dv)
+        if v_range is None or v_range[1] is None:
+            # fast_histogram excludes the top edge; clamp values on it into the last
+            # bin so results match the fallback path below (closed right edge when
+            # the range is derived from the data)
+            top = np.asarray(values) >= rng[1]
+            ntop = np.count_nonzero(top)
+        else:
+            ntop = 0
+        counts = _fast_histogram1d(values, bins=n, range=rng)
+        if ntop:
+            counts[-1] += ntop
+        if what is None:
+            return v_min, dv, counts.astype(np.intp)
+        result = [v_min, dv]
+        if isinstance(moments, int) or moments is None:
+            moments = [moments]
+        what = np.asarray(what)
+        nonzero = counts > 0
+        for m in moments:
+            power = m if m is not None else 1
+            w = what if power == 1 else what**power
+            v = _fast_histogram1d(values, bins=n, range=rng, weights=w)
+            if ntop:
+                v[-1] += np.sum(w[top])
+            if m is not None:
+                # divide by particle count to get mean (empty bins keep their sum of 0)
+                np.divide(v, counts, out=v, where=nonzero)
+            result.append(v)
+        return result
+
+    # count timestamps in bins (in-place ops to minimize temporaries on large data)
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        # keep single precision for the index computation (halves memory traffic,
+        # and the 24-bit mantissa is ample for bin indices)
+        bins = (values - np.float32(v_min)) * np.float32(1.0 / dv)
+    else:
+        bins = (values - v_min) * (1.0 / dv)
+    np.floor(bins, out=bins)
+    bins = bins.astype(np.intp)
     # bins are i*dt <= t < (i+1)*dt where i = 0 .. n-1
-    mask = (bins >= 0) & (bins < n)  # igore times outside range
-    bins = bins[mask]
+    if v_range is None or v_range[1] is None:
+        # values <= v_max holds by construction, only the maximum itself can land
+        # on the open upper edge: clamp it into the last bin instead of masking
+        np.minimum(bins, n - 1, out=bins)
+        mask = None
+    else:
+        mask = bins < n  # ignore values outside the user-provided range
+    if v_range is not None and v_range[0] is not None:
+        # the lower bound only needs checking for a user-provided range,
+        # otherwise values >= v_min holds by construction
+        below = bins >= 0
+        if mask is None:
+            mask = below
+        else:
+            mask &= below
+    if mask is not None:
+        bins = bins[mask]
     # count particles per time bin
     counts = np.bincount(bins, minlength=n)[:n]
 
@@ -249,14 +376,16 @@ def binned_data(
         result = [v_min, dv]
         if isinstance(moments, int) or moments is None:
             moments = [moments]
+        what = np.asarray(what) if mask is None else what[mask]
+        nonzero = counts > 0
         for m in moments:
-            v = np.zeros(n)
             # sum up 'what' for all the particles in each bin
+            # (bincount with weights is much faster than np.add.at)
             power = m if m is not None else 1
-            np.add.at(v, bins, what[mask] ** power)
+            v = np.bincount(bins, weights=what if power == 1 else what**power, minlength=n)[:n]
             if m is not None:
-                # divide by particle count to get mean (default to 0)
-                v[counts > 0] /= counts[counts > 0]
+                # divide by particle count to get mean (empty bins keep their sum of 0)
+                np.divide(v, counts, out=v, where=nonzero)
             result.append(v)
         return result
 
@@ -279,10 +408,12 @@ def normalized_coordinates(x, px, twiss, xy, delta=0):
     # substract (dispersive) closed orbit
     x = x - get(twiss, xy) - delta * get(twiss, "d" + xy)
     px = px - get(twiss, "p" + xy) - delta * get(twiss, "dp" + xy)
-    # apply Floquet transform
+    # apply Floquet transform (coefficients hoisted so each term is a single vector op)
     alf, bet = get(twiss, "alf" + xy), get(twiss, "bet" + xy)
-    X = x / bet**0.5
-    Px = alf * x / bet**0.5 + px * bet**0.5
+    sqrt_bet = bet**0.5
+    inv_sqrt_bet = 1 / sqrt_bet
+    X = x * inv_sqrt_bet
+    Px = (alf * inv_sqrt_bet) * x + px * sqrt_bet
     return X, Px
 
 
@@ -299,10 +430,12 @@ def denormalized_coordinates(X, Px, twiss, xy, delta=0):
     Returns:
         Tuple of physical coordinates (x, px) in (m, rad)
     """
-    # apply Floquet transform
+    # apply Floquet transform (coefficients hoisted so each term is a single vector op)
     alf, bet = get(twiss, "alf" + xy), get(twiss, "bet" + xy)
-    x = X * bet**0.5
-    px = -alf * X / bet**0.5 + Px / bet**0.5
+    sqrt_bet = bet**0.5
+    inv_sqrt_bet = 1 / sqrt_bet
+    x = X * sqrt_bet
+    px = (-alf * inv_sqrt_bet) * X + Px * inv_sqrt_bet
     # add (dispersive) closed orbit
     x = x + get(twiss, xy) + delta * get(twiss, "d" + xy)
     px = px + get(twiss, "p" + xy) + delta * get(twiss, "dp" + xy)